@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import cached_property
 import logging
 from typing import Any
 
@@ -12,12 +13,12 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import MarstekDataUpdateCoordinator
+from .entity import MarstekEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,6 +28,8 @@ class MarstekBinarySensorEntityDescription(BinarySensorEntityDescription):
     """Describes Marstek binary sensor entity."""
 
     value_fn: Callable[[dict[str, Any]], bool | None] | None = None
+    # Payload section handed to value_fn instead of the whole coordinator data
+    section: str | None = None
 
 
 # Only binary sensors for data that is actually available from VenusE 3.0
@@ -39,14 +42,16 @@ BINARY_SENSOR_TYPES: tuple[MarstekBinarySensorEntityDescription, ...] = (
         name="Battery Charging Allowed",
         device_class=BinarySensorDeviceClass.POWER,
         icon="mdi:battery-charging-check",
-        value_fn=lambda data: data.get("battery", {}).get("charg_flag"),
+        section="battery",
+        value_fn=lambda bat: bat.get("charg_flag"),
     ),
     MarstekBinarySensorEntityDescription(
         key="battery_discharging_allowed",
         name="Battery Discharging Allowed",
         device_class=BinarySensorDeviceClass.POWER,
         icon="mdi:battery-minus-check",
-        value_fn=lambda data: data.get("battery", {}).get("dischrg_flag"),
+        section="battery",
+        value_fn=lambda bat: bat.get("dischrg_flag"),
     ),
 )
 
@@ -59,17 +64,17 @@ async def async_setup_entry(
     """Set up Marstek binary sensor based on a config entry."""
     coordinator: MarstekDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
+    # Data is already loaded by the first refresh, so no update before add
     async_add_entities(
-        MarstekBinarySensor(coordinator, description, entry)
-        for description in BINARY_SENSOR_TYPES
+        [MarstekBinarySensor(coordinator, description, entry) for description in BINARY_SENSOR_TYPES],
+        update_before_add=False,
     )
 
 
-class MarstekBinarySensor(CoordinatorEntity[MarstekDataUpdateCoordinator], BinarySensorEntity):
+class MarstekBinarySensor(MarstekEntity, BinarySensorEntity):
     """Representation of a Marstek binary sensor."""
 
     entity_description: MarstekBinarySensorEntityDescription
-    _attr_has_entity_name = True
 
     def __init__(
         self,
@@ -80,39 +85,24 @@ class MarstekBinarySensor(CoordinatorEntity[MarstekDataUpdateCoordinator], Binar
         """Initialize the binary sensor."""
         super().__init__(coordinator)
         self.entity_description = description
-        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-        
-        # Get device info from coordinator data
-        device_info = coordinator.data.get("device", {})
-        device_name = device_info.get("device", "Unknown")
-        firmware_ver = device_info.get("ver", "Unknown")
-        
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": entry.title,
-            "manufacturer": "Marstek",
-            "model": device_name,
-            "sw_version": str(firmware_ver),
-        }
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if the binary sensor is on."""
-        if self.entity_description.value_fn is None:
-            return None
-        
-        value = self.entity_description.value_fn(self.coordinator.data)
-        
-        if value is None:
-            return None
-        
-        return bool(value)
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and self.is_on is not None
-        )
-
+        self._entry_id = entry.entry_id
+
+    @cached_property
+    def unique_id(self) -> str:
+        """Return the unique ID, built on first access."""
+        return f"{self._entry_id}_{self.entity_description.key}"
+
+    @callback
+    def _update_attrs(self) -> None:
+        """Evaluate the value function once and cache the result."""
+        description = self.entity_description
+        data = self.coordinator.data
+        if description.section is not None:
+            data = data[description.section]
+
+        value = None
+        if description.value_fn is not None:
+            value = description.value_fn(data)
+
+        self._attr_is_on = bool(value) if value is not None else None
+        self._attr_available = self.coordinator.last_update_success and value is not None
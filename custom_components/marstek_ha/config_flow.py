@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from time import monotonic
 from typing import Any
 
 import voluptuous as vol
@@ -23,6 +24,10 @@ from .marstek_api import MarstekAPI
 
 _LOGGER = logging.getLogger(__name__)
 
+# Successful device probes by (host, port), reused when the form is resubmitted
+_DEVICE_PROBE_TTL = 30.0
+_DEVICE_PROBE_CACHE: dict[tuple[str, int], tuple[float, dict[str, Any]]] = {}
+
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect."""
@@ -30,6 +35,13 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     port = data.get(CONF_DEVICE_PORT, DEFAULT_PORT)
     local_port = port  # Use same port for local binding
 
+    key = (host, port)
+    if (cached := _DEVICE_PROBE_CACHE.get(key)) is not None:
+        probed_at, info = cached
+        if monotonic() - probed_at < _DEVICE_PROBE_TTL:
+            return info
+        del _DEVICE_PROBE_CACHE[key]
+
     api = MarstekAPI(host, port, local_port)
 
     try:
@@ -38,6 +50,9 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
 
         device_info = await api.get_device_info()
 
+        if device_info is None:
+            # connect() only binds the local port, so silence here means unreachable
+            raise CannotConnect("Device did not respond")
         if not device_info:
             raise InvalidDevice("Device connected but did not return valid information")
 
@@ -45,11 +60,14 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
         device_name = device_info.get("device", "Marstek Device")
         ble_mac = device_info.get("ble_mac", "unknown")
 
-        return {
+        info = {
             "title": device_name,
             "serial": ble_mac,  # Use BLE MAC as serial
             "model": device_name,
         }
+        _DEVICE_PROBE_CACHE[key] = (monotonic(), info)
+
+        return info
     except asyncio.TimeoutError:
         raise CannotConnect("Connection timeout")
     except ConnectionRefusedError:
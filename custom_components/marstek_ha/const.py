@@ -1,4 +1,5 @@
 """Constants for the Marstek integration."""
+from types import MappingProxyType
 
 DOMAIN = "marstek_ha"
 
@@ -10,6 +11,12 @@ CONF_DEVICE_PORT = "device_port"
 DEFAULT_PORT = 30000  # UDP port for API communication
 DEFAULT_SCAN_INTERVAL = 30
 DEFAULT_TIMEOUT = 3
+# Deadline for a whole refresh: the three polled commands share one socket
+# and run one after another, plus some slack
+DEFAULT_UPDATE_TIMEOUT = DEFAULT_TIMEOUT * 3 + 1
+
+# Coordinator data key holding the flattened sensor snapshot
+DATA_FLAT = "_flat"
 
 # API Commands
 CMD_GET_DEVICE = "Marstek.GetDevice"
@@ -34,6 +41,24 @@ ES_MODES = [
     ES_MODE_MANUAL,
     ES_MODE_PASSIVE,
 ]
+# Set view of ES_MODES for membership checks; ES_MODES keeps the option order
+ES_MODES_SET = frozenset(ES_MODES)
+
+# Default mode configurations for ES.SetMode (read-only, shared by all calls)
+DEFAULT_AUTO_CFG = MappingProxyType({"enable": 1})
+DEFAULT_AI_CFG = MappingProxyType({"enable": 1})
+DEFAULT_MANUAL_CFG = MappingProxyType({
+    "time_num": 1,
+    "start_time": "08:30",
+    "end_time": "20:30",
+    "week_set": 127,
+    "power": 100,
+    "enable": 1,
+})
+DEFAULT_PASSIVE_CFG = MappingProxyType({
+    "power": 100,
+    "cd_time": 300,
+})
 
 # Sensor Types
 SENSOR_BATTERY_SOC = "battery_soc"
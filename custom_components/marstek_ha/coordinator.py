@@ -1,25 +1,92 @@
 """DataUpdateCoordinator for Marstek."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable
 from datetime import timedelta
+from functools import partial
+import hashlib
 import logging
 from typing import Any
 
+import orjson
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
     CONF_DEVICE_IP,
     CONF_DEVICE_PORT,
+    DATA_FLAT,
     DEFAULT_PORT,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_UPDATE_TIMEOUT,
     DOMAIN,
 )
 from .marstek_api import MarstekAPI
 
 _LOGGER = logging.getLogger(__name__)
 
+# Payload sections, guaranteed to be dicts once the coordinator has them
+_SECTIONS = ("device", "battery", "es_mode")
+
+
+def _make_getter(
+    section: str,
+    field: str,
+    transform: Callable[[Any], Any] | None = None,
+) -> Callable[[dict[str, Any]], Any]:
+    """Return an accessor for one field of a normalized payload section."""
+
+    def getter(data: dict[str, Any]) -> Any:
+        value = data[section].get(field)
+        if value is None or transform is None:
+            return value
+        return transform(value)
+
+    return getter
+
+
+# All accessors share the single getter code object; only the section and
+# field they close over differ
+_battery_field = partial(_make_getter, "battery")
+_es_field = partial(_make_getter, "es_mode")
+_device_field = partial(_make_getter, "device")
+
+# Sensor key -> accessor into the raw device payload
+_SENSOR_GETTERS: dict[str, Callable[[dict[str, Any]], Any]] = {
+    "battery_soc": _battery_field("soc"),
+    # bat_temp is in °C * 10, so divide by 10
+    "battery_temperature": _battery_field("bat_temp", lambda v: v / 10.0),
+    # bat_capacity is in Wh / 10, so multiply by 10
+    "battery_capacity": _battery_field("bat_capacity", lambda v: v * 10.0),
+    "battery_rated_capacity": _battery_field("rated_capacity"),
+    "es_mode": _es_field("mode"),
+    # ongrid_power: negative = feeding to grid, positive = consuming from grid
+    "grid_power": _es_field("ongrid_power"),
+    "offgrid_power": _es_field("offgrid_power"),
+    "phase_a_power": _es_field("a_power"),
+    "phase_b_power": _es_field("b_power"),
+    "phase_c_power": _es_field("c_power"),
+    "total_power": _es_field("total_power"),
+    "firmware_version": _device_field("ver"),
+    "wifi_ssid": _device_field("wifi_name"),
+}
+
+
+def _flatten(data: dict[str, Any]) -> dict[str, Any]:
+    """Resolve every sensor value from the raw device payload in one pass."""
+    flat = {key: getter(data) for key, getter in _SENSOR_GETTERS.items()}
+
+    # Feeding to grid = charging, consuming from grid = discharging
+    ongrid = flat["grid_power"]
+    flat["battery_charging_power"] = -ongrid if ongrid is not None and ongrid < 0 else 0
+    flat["battery_discharging_power"] = ongrid if ongrid is not None and ongrid > 0 else 0
+
+    return flat
+
 
 class MarstekDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Class to manage fetching Marstek data."""
@@ -33,24 +100,79 @@ class MarstekDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             port,  # Use same port for local binding
         )
         self.entry = entry
+        self.device_info: DeviceInfo | None = None
+        self._last_digest: bytes | None = None
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            # Only notify entities when the returned data actually changed
+            always_update=False,
+        )
+
+    async def async_config_entry_first_refresh(self) -> None:
+        """Refresh data for the first time and cache the static device info."""
+        await super().async_config_entry_first_refresh()
+        self.device_info = self._build_device_info()
+
+    def _build_device_info(self) -> DeviceInfo:
+        """Build the device info shared by all entities of this entry."""
+        device = self.data["device"]
+
+        return DeviceInfo(
+            identifiers={(DOMAIN, self.entry.entry_id)},
+            name=self.entry.title,
+            manufacturer="Marstek",
+            model=device.get("device", "Unknown"),
+            sw_version=str(device.get("ver", "Unknown")),
         )
 
+    @callback
+    def async_set_optimistic_es_mode(self, mode: str) -> None:
+        """Push an accepted ES mode change to entities without polling."""
+        data = dict(self.data)
+        data["es_mode"] = {**data["es_mode"], "mode": mode}
+        data[DATA_FLAT] = _flatten(data)
+
+        # Make sure the next poll is published even if the payload looks unchanged
+        self._last_digest = None
+        self.async_set_updated_data(data)
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from API."""
         try:
-            data = await self.api.get_all_data()
+            # Bound the whole refresh so a stuck exchange cannot delay every entity
+            async with asyncio.timeout(DEFAULT_UPDATE_TIMEOUT):
+                data = await self.api.get_all_data()
 
             if not data:
                 raise UpdateFailed("Failed to fetch data from device")
 
+            # Missing or malformed sections become empty dicts, so nothing
+            # downstream has to type-check them again
+            for section in _SECTIONS:
+                if not isinstance(data.get(section), dict):
+                    data[section] = {}
+
+            # Idle devices mostly return identical payloads; hand back the
+            # current snapshot so entities skip the state write
+            digest = hashlib.blake2b(
+                orjson.dumps(data, default=str, option=orjson.OPT_SORT_KEYS),
+                digest_size=8,
+            ).digest()
+            if digest == self._last_digest and self.data is not None:
+                return self.data
+            self._last_digest = digest
+
+            data[DATA_FLAT] = _flatten(data)
             return data
 
+        except TimeoutError as err:
+            raise UpdateFailed(
+                f"Timed out after {DEFAULT_UPDATE_TIMEOUT}s fetching data from device"
+            ) from err
         except Exception as err:
             raise UpdateFailed(f"Error communicating with device: {err}") from err
 
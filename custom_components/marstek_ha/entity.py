@@ -0,0 +1,42 @@
+"""Base entity for Marstek."""
+from __future__ import annotations
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import MarstekDataUpdateCoordinator
+
+
+class MarstekEntity(CoordinatorEntity[MarstekDataUpdateCoordinator]):
+    """Base for Marstek entities whose state is cached on coordinator updates."""
+
+    _attr_has_entity_name = True
+    # State is pushed by the coordinator via _handle_coordinator_update
+    _attr_should_poll = False
+
+    def __init__(self, coordinator: MarstekDataUpdateCoordinator) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._attr_device_info = coordinator.device_info
+
+    async def async_added_to_hass(self) -> None:
+        """Prime the cached state before the first state write."""
+        self._update_attrs()
+        await super().async_added_to_hass()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_attrs()
+        self.async_write_ha_state()
+
+    @callback
+    def _update_attrs(self) -> None:
+        """Cache the entity state from the latest coordinator data."""
+        raise NotImplementedError
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        # CoordinatorEntity overrides available, so point it back at the cache
+        return self._attr_available
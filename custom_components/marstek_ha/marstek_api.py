@@ -2,11 +2,16 @@
 from __future__ import annotations
 
 import asyncio
-import json
+from collections import OrderedDict
+from collections.abc import Mapping
 import logging
 import socket
+import time
+from types import MappingProxyType
 from typing import Any
 
+import orjson
+
 from .const import (
     CMD_BAT_STATUS,
     CMD_BLE_STATUS,
@@ -16,12 +21,84 @@ from .const import (
     CMD_GET_DEVICE,
     CMD_PV_STATUS,
     CMD_WIFI_STATUS,
+    DEFAULT_AI_CFG,
+    DEFAULT_AUTO_CFG,
+    DEFAULT_MANUAL_CFG,
+    DEFAULT_PASSIVE_CFG,
     DEFAULT_PORT,
     DEFAULT_TIMEOUT,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# The firmware only answers requests with id 1, so ids cannot be used to run
+# several exchanges at once; MarstekAPI serializes them on this single id
+_REQUEST_ID = 1
+
+# Params for commands that take no device id
+_DEFAULT_PARAMS: Mapping[str, Any] = MappingProxyType({"ble_mac": "0"})
+
+# Marks a missing response member, which unlike null is not a result
+_MISSING = object()
+
+# Seconds a successful response may be reused; device info is effectively static
+_RESPONSE_TTL: dict[str, float] = {
+    CMD_GET_DEVICE: 300.0,
+    CMD_BAT_STATUS: 0.0,
+    CMD_ES_GET_MODE: 0.0,
+}
+# Upper bound on cached responses, in case commands gain per-id parameters
+_RESPONSE_CACHE_SIZE = 64
+
+
+class _MarstekProtocol(asyncio.DatagramProtocol):
+    """Datagram protocol routing device responses to pending requests by id."""
+
+    def __init__(self) -> None:
+        """Initialize the protocol."""
+        self.pending: dict[Any, asyncio.Future[dict[str, Any]]] = {}
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Decode a response and resolve the request waiting for its id."""
+        # Formatting the raw datagram is costly, so skip it unless debugging
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("  ✓ Received %d bytes from %s", len(data), addr)
+            _LOGGER.debug("  Raw response (hex): %s", data.hex())
+            _LOGGER.debug("  Raw response (ascii): %s", data)
+            _LOGGER.debug("  Decoded response: %s", data.decode('utf-8', errors='ignore'))
+
+        try:
+            # orjson parses the datagram bytes directly
+            response = orjson.loads(data)
+        except orjson.JSONDecodeError as err:
+            # Without an id the error can only go to whoever is waiting
+            _LOGGER.error("  → Response was: %s", data)
+            self._fail_pending(err)
+            return
+
+        request_id = response.get("id") if isinstance(response, dict) else None
+        future = self.pending.pop(request_id, None)
+        if future is None:
+            _LOGGER.debug("  Ignoring response without a pending request: %s", response)
+            return
+        if not future.done():
+            future.set_result(response)
+
+    def error_received(self, exc: Exception) -> None:
+        """Fail pending requests on ICMP errors such as port unreachable."""
+        self._fail_pending(exc)
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        """Fail pending requests when the endpoint is closed."""
+        self._fail_pending(exc or ConnectionAbortedError("UDP endpoint closed"))
+
+    def _fail_pending(self, exc: Exception) -> None:
+        """Propagate an error to every pending request."""
+        for future in self.pending.values():
+            if not future.done():
+                future.set_exception(exc)
+        self.pending.clear()
+
 
 class MarstekAPI:
     """Marstek API client using UDP protocol."""
@@ -37,35 +114,55 @@ class MarstekAPI:
         self.host = host
         self.port = port
         self.local_port = local_port
-        self._sock: socket.socket | None = None
-        self._connected = False
+        self._transport: asyncio.DatagramTransport | None = None
+        self._protocol: _MarstekProtocol | None = None
+        # Port actually bound, which differs from local_port after a fallback
+        self._bound_port: int | None = None
         self._timeout = DEFAULT_TIMEOUT
+        self._payload_cache: dict[tuple[str, tuple[tuple[str, Any], ...]], bytes] = {}
+        # (command, params) -> (expiry, result), least recently used first
+        self._response_cache: OrderedDict[
+            tuple[str, frozenset[tuple[str, Any]]], tuple[float, dict[str, Any]]
+        ] = OrderedDict()
+        # Only one exchange may be in flight on _REQUEST_ID at a time
+        self._lock = asyncio.Lock()
+        self._connect_lock = asyncio.Lock()
+
+    @property
+    def _endpoint_open(self) -> bool:
+        """Return True while the datagram endpoint can still be used."""
+        return self._transport is not None and not self._transport.is_closing()
 
     async def connect(self) -> bool:
         """Connect (bind) to the local UDP port."""
-        try:
-            # Create UDP socket
-            self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            self._sock.settimeout(self._timeout)
+        loop = asyncio.get_running_loop()
+        if self._transport is not None and not self._endpoint_open:
+            # Drop an endpoint that was lost so its port can be bound again
+            await self.disconnect()
 
+        try:
             # Bind to local port
             try:
-                self._sock.bind(('', self.local_port))
+                self._transport, self._protocol = await loop.create_datagram_endpoint(
+                    _MarstekProtocol,
+                    local_addr=("0.0.0.0", self.local_port),
+                    family=socket.AF_INET,
+                )
             except OSError as bind_err:
                 _LOGGER.debug("Could not bind to port %s, using random port: %s", self.local_port, bind_err)
                 # Try with random port
-                self._sock.bind(('', 0))
+                self._transport, self._protocol = await loop.create_datagram_endpoint(
+                    _MarstekProtocol,
+                    local_addr=("0.0.0.0", 0),
+                    family=socket.AF_INET,
+                )
 
-            self._connected = True
+            self._bound_port = self._transport.get_extra_info("sockname")[1]
 
-            # Test connection with a simple command
-            device_info = await self.get_device_info()
-            if device_info:
-                _LOGGER.debug("Successfully connected to Marstek device")
-                return True
-            else:
-                _LOGGER.error("Device did not respond to test command")
-                return False
+            # UDP is connectionless, so binding is all there is to connecting;
+            # the first real command shows whether the device answers
+            _LOGGER.debug("UDP endpoint bound to local port %s", self._bound_port)
+            return True
 
         except OSError as err:
             _LOGGER.error("Failed to create UDP socket: %s", err)
@@ -75,103 +172,169 @@ class MarstekAPI:
             return False
 
     async def disconnect(self) -> None:
-        """Close the UDP socket."""
-        if self._sock:
+        """Close the UDP endpoint."""
+        if self._transport:
             try:
-                self._sock.close()
+                self._transport.close()
                 _LOGGER.debug("UDP socket closed")
             except Exception as err:
                 _LOGGER.debug("Error closing socket: %s", err)
             finally:
-                self._sock = None
-                self._connected = False
-
-    async def _send_command(self, command: str, params: dict[str, Any] | None = None) -> dict[str, Any] | None:
-        """Send a command to the device via UDP and return the response."""
-        if not self._sock:
-            _LOGGER.debug("No active socket, attempting to connect...")
-            if not await self.connect():
-                _LOGGER.error("Cannot send command '%s': connection failed", command)
-                return None
-
-        try:
-            # Build request according to protocol format
-            # Based on user's example: {"id":1,"method":"Marstek.GetDevice","params":{"ble_mac":"0"}}
-            # Note: ID must be constant (1), not incrementing
-            request = {
-                "id": 1,
-                "method": command,
-                "params": params or {}
-            }
-
-            # Add default params if not provided
-            if not request["params"]:
-                request["params"] = {"ble_mac": "0"}
-
-            message = json.dumps(request, separators=(',', ':')).encode('utf-8')
-
-            _LOGGER.info("→ Sending UDP command: %s", command)
-            _LOGGER.debug("  Request payload: %s", message.decode('utf-8'))
-            _LOGGER.debug("  Request size: %d bytes", len(message))
-            _LOGGER.debug("  Sending from local port %s to %s:%s", 
-                         self._sock.getsockname()[1] if self._sock else "unknown",
-                         self.host, self.port)
-
-            # Send the command via UDP
-            await asyncio.get_event_loop().run_in_executor(
-                None, self._sock.sendto, message, (self.host, self.port)
-            )
-            _LOGGER.debug("  ✓ Command sent, waiting for response...")
+                self._transport = None
+                self._protocol = None
+                self._bound_port = None
+
+    async def _ensure_endpoint(self) -> bool:
+        """Bind the datagram endpoint if it is not open yet."""
+        # The endpoint stays open across commands; only rebind once it is gone
+        if not self._endpoint_open:
+            # Concurrent callers share one bind attempt
+            async with self._connect_lock:
+                if not self._endpoint_open:
+                    _LOGGER.debug("No active socket, attempting to connect...")
+                    return await self.connect()
+        return True
+
+    def _cache_response(
+        self,
+        key: tuple[str, frozenset[tuple[str, Any]]],
+        expires_at: float,
+        result: dict[str, Any],
+    ) -> None:
+        """Store a response, evicting the least recently used one when full."""
+        self._response_cache[key] = (expires_at, result)
+        self._response_cache.move_to_end(key)
+        if len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+
+    def _invalidate_responses(self, command: str) -> None:
+        """Drop every cached response for a command."""
+        for key in [key for key in self._response_cache if key[0] == command]:
+            del self._response_cache[key]
+
+    async def _send_command(
+        self,
+        command: str,
+        params: Mapping[str, Any] = _DEFAULT_PARAMS,
+    ) -> dict[str, Any] | None:
+        """Send a command to the device via UDP and return the response.
+
+        Encoded payloads are cached per (command, params) when the params are
+        flat; nested params such as ES.SetMode configs are encoded every time.
+        """
+        # Debug arguments below allocate, so only build them when they are logged
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+
+        ttl = _RESPONSE_TTL.get(command, 0.0)
+        response_key = (command, frozenset(params.items())) if ttl else None
+        if response_key and (cached := self._response_cache.get(response_key)) is not None:
+            expires_at, cached_result = cached
+            if time.monotonic() < expires_at:
+                _LOGGER.debug("Using cached response for '%s'", command)
+                self._response_cache.move_to_end(response_key)
+                return cached_result
+            del self._response_cache[response_key]
+
+        if not await self._ensure_endpoint():
+            _LOGGER.error("Cannot send command '%s': connection failed", command)
+            return None
 
-            # Receive response
+        async with self._lock:
             try:
-                response_data, addr = await asyncio.get_event_loop().run_in_executor(
-                    None, self._sock.recvfrom, 4096
-                )
-                
-                _LOGGER.debug("  ✓ Received %d bytes from %s", len(response_data), addr)
-                _LOGGER.debug("  Raw response (hex): %s", response_data.hex())
-                _LOGGER.debug("  Raw response (ascii): %s", response_data)
-
-                # Decode response
-                response_str = response_data.decode('utf-8', errors='ignore')
-                _LOGGER.debug("  Decoded response: %s", response_str)
+                # Polling commands always send the same bytes, so reuse them
+                cache_key: tuple[str, tuple[tuple[str, Any], ...]] | None
+                try:
+                    cache_key = (command, tuple(sorted(params.items())))
+                    message = self._payload_cache.get(cache_key)
+                except TypeError:
+                    # Unhashable (nested) params cannot key the cache
+                    cache_key = message = None
+
+                if message is None:
+                    # Build request according to protocol format
+                    # Based on user's example: {"id":1,"method":"Marstek.GetDevice","params":{"ble_mac":"0"}}
+                    # Note: ID must be constant (1), not incrementing
+                    request = {
+                        "id": _REQUEST_ID,
+                        "method": command,
+                        "params": params,
+                    }
+                    # orjson cannot encode the read-only MappingProxyType defaults itself
+                    message = orjson.dumps(request, default=dict)
+
+                    if cache_key:
+                        self._payload_cache[cache_key] = message
+
+                _LOGGER.info("→ Sending UDP command: %s", command)
+                if debug:
+                    _LOGGER.debug("  Request payload: %s", message.decode('utf-8'))
+                    _LOGGER.debug("  Request size: %d bytes", len(message))
+                    _LOGGER.debug("  Sending from local port %s to %s:%s",
+                                 self._bound_port,
+                                 self.host, self.port)
+
+                # The protocol resolves this future when the matching response arrives
+                future = asyncio.get_running_loop().create_future()
+                self._protocol.pending[_REQUEST_ID] = future
+                try:
+                    # Send the command via UDP
+                    self._transport.sendto(message, (self.host, self.port))
+                    _LOGGER.debug("  ✓ Command sent, waiting for response...")
+
+                    response = await asyncio.wait_for(future, self._timeout)
+                finally:
+                    self._protocol.pending.pop(_REQUEST_ID, None)
 
-                # Parse JSON
-                response = json.loads(response_str)
                 _LOGGER.info("← Received response for '%s'", command)
-                
-                if "result" in response:
-                    _LOGGER.debug("  ✓ Command successful, result keys: %s", list(response["result"].keys()))
-                    return response["result"]
-                elif "error" in response:
-                    _LOGGER.error("  ✗ Device returned error: %s", response["error"])
+
+                result = response.get("result", _MISSING)
+                if result is not _MISSING:
+                    if debug:
+                        _LOGGER.debug("  ✓ Command successful, result keys: %s",
+                                     list(result.keys()) if isinstance(result, dict) else result)
+                    if response_key and result is not None:
+                        self._cache_response(response_key, time.monotonic() + ttl, result)
+                    return result
+
+                error = response.get("error", _MISSING)
+                if error is not _MISSING:
+                    _LOGGER.error("  ✗ Device returned error: %s", error)
                     return None
-                else:
-                    _LOGGER.warning("  ⚠ Unexpected response format: %s", response)
-                    return response
-
-            except socket.timeout:
-                _LOGGER.error("  ✗ Timeout waiting for response (waited %s seconds)", self._timeout)
-                _LOGGER.error("  → Check if the device IP is correct: %s", self.host)
-                _LOGGER.error("  → Check if the device port is correct: %s", self.port)
-                _LOGGER.error("  → Check if the device is powered on and connected")
+
+                _LOGGER.warning("  ⚠ Unexpected response format: %s", response)
+                return response
+
+            except TimeoutError:
+                _LOGGER.error(
+                    "  ✗ Timeout waiting for response (waited %s seconds)\n"
+                    "  → Check if the device IP is correct: %s\n"
+                    "  → Check if the device port is correct: %s\n"
+                    "  → Check if the device is powered on and connected",
+                    self._timeout, self.host, self.port,
+                )
                 return None
-            except ConnectionResetError:
-                _LOGGER.error("  ✗ ConnectionResetError: Remote host sent Port Unreachable (ICMP)")
-                _LOGGER.error("  → The device is reachable but port %s is closed", self.port)
-                _LOGGER.error("  → Check if the correct port is configured")
+            except (ConnectionRefusedError, ConnectionResetError) as err:
+                _LOGGER.error(
+                    "  ✗ %s: Remote host sent Port Unreachable (ICMP)\n"
+                    "  → The device is reachable but port %s is closed\n"
+                    "  → Check if the correct port is configured",
+                    type(err).__name__, self.port,
+                )
+                return None
+            except orjson.JSONDecodeError as err:
+                _LOGGER.error(
+                    "  ✗ Failed to parse JSON response: %s\n"
+                    "  → The device might not be using the expected protocol",
+                    err,
+                )
+                return None
+            except Exception as err:
+                _LOGGER.error(
+                    "  ✗ Error sending command '%s': %s\n"
+                    "  → Error type: %s",
+                    command, err, type(err).__name__,
+                )
                 return None
-
-        except json.JSONDecodeError as err:
-            _LOGGER.error("  ✗ Failed to parse JSON response: %s", err)
-            _LOGGER.error("  → Response was: %s", response_data if 'response_data' in locals() else "no data")
-            _LOGGER.error("  → The device might not be using the expected protocol")
-            return None
-        except Exception as err:
-            _LOGGER.error("  ✗ Error sending command '%s': %s", command, err)
-            _LOGGER.error("  → Error type: %s", type(err).__name__)
-            return None
 
     async def get_device_info(self) -> dict[str, Any] | None:
         """Get device information."""
@@ -217,26 +380,16 @@ class MarstekAPI:
             config = {}
 
         # Prepare mode-specific configuration
-        mode_config = {"mode": mode}
+        mode_config: dict[str, Any] = {"mode": mode}
 
         if mode == "Auto":
-            mode_config["auto_cfg"] = config.get("auto_cfg", {"enable": 1})
+            mode_config["auto_cfg"] = config.get("auto_cfg", DEFAULT_AUTO_CFG)
         elif mode == "AI":
-            mode_config["ai_cfg"] = config.get("ai_cfg", {"enable": 1})
+            mode_config["ai_cfg"] = config.get("ai_cfg", DEFAULT_AI_CFG)
         elif mode == "Manual":
-            mode_config["manual_cfg"] = config.get("manual_cfg", {
-                "time_num": 1,
-                "start_time": "08:30",
-                "end_time": "20:30",
-                "week_set": 127,
-                "power": 100,
-                "enable": 1
-            })
+            mode_config["manual_cfg"] = config.get("manual_cfg", DEFAULT_MANUAL_CFG)
         elif mode == "Passive":
-            mode_config["passive_cfg"] = config.get("passive_cfg", {
-                "power": 100,
-                "cd_time": 300
-            })
+            mode_config["passive_cfg"] = config.get("passive_cfg", DEFAULT_PASSIVE_CFG)
 
         params = {
             "id": 1,
@@ -244,6 +397,8 @@ class MarstekAPI:
         }
 
         result = await self._send_command(CMD_ES_SET_MODE, params)
+        # The mode just changed, so a cached ES.GetMode answer would be stale
+        self._invalidate_responses(CMD_ES_GET_MODE)
 
         # Check if the result indicates success
         if result and result.get("set_result") is True:
@@ -262,16 +417,26 @@ class MarstekAPI:
         _LOGGER.debug("Fetching all data from device...")
 
         # Only use commands that work with VenusE 3.0
+        device, battery, es_mode = await asyncio.gather(
+            self.get_device_info(),
+            self.get_battery_status(),
+            self.get_es_mode(),
+            return_exceptions=True,
+        )
+
+        # A failing command is reported as a missing section, not a failed fetch
         data = {
-            "device": await self.get_device_info(),
-            "battery": await self.get_battery_status(),
-            "es_mode": await self.get_es_mode(),
+            key: None if isinstance(value, BaseException) else value
+            for key, value in (
+                ("device", device),
+                ("battery", battery),
+                ("es_mode", es_mode),
+            )
         }
 
-        _LOGGER.debug("Data fetch complete. Successful: %s/%s",
-                     sum(1 for v in data.values() if v is not None),
-                     len(data))
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Data fetch complete. Successful: %s/%s",
+                         sum(1 for v in data.values() if v is not None),
+                         len(data))
 
         return data
-
-
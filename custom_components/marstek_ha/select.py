@@ -6,12 +6,12 @@ from typing import Any
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, ES_MODES
+from .const import DOMAIN, ES_MODES, ES_MODES_SET
 from .coordinator import MarstekDataUpdateCoordinator
+from .entity import MarstekEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,10 +27,9 @@ async def async_setup_entry(
     async_add_entities([MarstekESModeSelect(coordinator, entry)])
 
 
-class MarstekESModeSelect(CoordinatorEntity[MarstekDataUpdateCoordinator], SelectEntity):
+class MarstekESModeSelect(MarstekEntity, SelectEntity):
     """Representation of Marstek Energy Storage Mode selector."""
 
-    _attr_has_entity_name = True
     _attr_name = "Energy Storage Mode"
     _attr_icon = "mdi:battery-charging"
 
@@ -44,36 +43,27 @@ class MarstekESModeSelect(CoordinatorEntity[MarstekDataUpdateCoordinator], Selec
         self._attr_unique_id = f"{entry.entry_id}_es_mode"
         self._attr_options = ES_MODES
 
-        # Get device info from coordinator data
-        device_info = coordinator.data.get("device", {})
-        device_name = device_info.get("device", "Unknown")
-        firmware_ver = device_info.get("ver", "Unknown")
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        previous = (self._attr_current_option, self._attr_available)
+        self._update_attrs()
+        # Other sections of the payload change far more often than the mode
+        if (self._attr_current_option, self._attr_available) != previous:
+            self.async_write_ha_state()
 
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": entry.title,
-            "manufacturer": "Marstek",
-            "model": device_name,
-            "sw_version": str(firmware_ver),
-        }
+    @callback
+    def _update_attrs(self) -> None:
+        """Resolve the current mode once and cache the result."""
+        mode = self.coordinator.data["es_mode"].get("mode")
+        option = mode if mode in ES_MODES_SET else None
 
-    @property
-    def current_option(self) -> str | None:
-        """Return the current selected option."""
-        es_mode_data = self.coordinator.data.get("es_mode")
-
-        # es_mode can be a dict or None
-        if isinstance(es_mode_data, dict):
-            mode = es_mode_data.get("mode")
-
-            if mode in ES_MODES:
-                return mode
-
-        return None
+        self._attr_current_option = option
+        self._attr_available = self.coordinator.last_update_success and option is not None
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
-        if option not in ES_MODES:
+        if option not in ES_MODES_SET:
             _LOGGER.error("Invalid ES mode: %s", option)
             return
 
@@ -82,16 +72,7 @@ class MarstekESModeSelect(CoordinatorEntity[MarstekDataUpdateCoordinator], Selec
 
         if result:
             _LOGGER.info("Successfully set ES mode to: %s", option)
-            # Request immediate update
-            await self.coordinator.async_request_refresh()
+            # Show the new mode right away; the next poll confirms it
+            self.coordinator.async_set_optimistic_es_mode(option)
         else:
             _LOGGER.error("Failed to set ES mode to %s", option)
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and self.current_option is not None
-        )
-
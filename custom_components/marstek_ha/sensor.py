@@ -1,10 +1,8 @@
 """Sensor platform for Marstek."""
 from __future__ import annotations
 
-from collections.abc import Callable
-from dataclasses import dataclass
+from functools import cache, cached_property
 import logging
-from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -22,149 +20,62 @@ from homeassistant.const import (
     UnitOfTemperature,
     SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DATA_FLAT, DOMAIN
 from .coordinator import MarstekDataUpdateCoordinator
+from .entity import MarstekEntity
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
-class MarstekSensorEntityDescription(SensorEntityDescription):
-    """Describes Marstek sensor entity."""
-
-    value_fn: Callable[[dict[str, Any]], Any] | None = None
-
+# (key, name, unit, device class, state class, icon)
+_SensorRow = tuple[
+    str, str, str | None, SensorDeviceClass | None, SensorStateClass | None, str | None
+]
 
 # Only sensors for data that is actually available from VenusE 3.0
-SENSOR_TYPES: tuple[MarstekSensorEntityDescription, ...] = (
+# Values are resolved by key from the coordinator's flattened snapshot
+# Kept as plain tuples; descriptions are only built on first setup
+_SENSOR_TABLE: tuple[_SensorRow, ...] = (
     # Battery sensors (from Bat.GetStatus)
-    MarstekSensorEntityDescription(
-        key="battery_soc",
-        name="Battery State of Charge",
-        native_unit_of_measurement=PERCENTAGE,
-        device_class=SensorDeviceClass.BATTERY,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("battery", {}).get("soc"),
-    ),
-    MarstekSensorEntityDescription(
-        key="battery_temperature",
-        name="Battery Temperature",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_class=SensorDeviceClass.TEMPERATURE,
-        state_class=SensorStateClass.MEASUREMENT,
-        # bat_temp is in °C * 10, so divide by 10
-        value_fn=lambda data: data.get("battery", {}).get("bat_temp") / 10.0 if data.get("battery", {}).get("bat_temp") is not None else None,
-    ),
-    MarstekSensorEntityDescription(
-        key="battery_capacity",
-        name="Battery Capacity",
-        native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY_STORAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        # bat_capacity is in Wh / 10, so multiply by 10
-        value_fn=lambda data: data.get("battery", {}).get("bat_capacity") * 10.0 if data.get("battery", {}).get("bat_capacity") is not None else None,
-    ),
-    MarstekSensorEntityDescription(
-        key="battery_rated_capacity",
-        name="Battery Rated Capacity",
-        native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY_STORAGE,
-        value_fn=lambda data: data.get("battery", {}).get("rated_capacity"),
-    ),
+    ("battery_soc", "Battery State of Charge", PERCENTAGE, SensorDeviceClass.BATTERY, SensorStateClass.MEASUREMENT, None),
+    ("battery_temperature", "Battery Temperature", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE, SensorStateClass.MEASUREMENT, None),
+    ("battery_capacity", "Battery Capacity", UnitOfEnergy.WATT_HOUR, SensorDeviceClass.ENERGY_STORAGE, SensorStateClass.MEASUREMENT, None),
+    ("battery_rated_capacity", "Battery Rated Capacity", UnitOfEnergy.WATT_HOUR, SensorDeviceClass.ENERGY_STORAGE, None, None),
     # Energy Storage sensors (from ES.GetMode)
-    MarstekSensorEntityDescription(
-        key="es_mode",
-        name="Energy Storage Mode",
-        value_fn=lambda data: data.get("es_mode", {}).get("mode") if isinstance(data.get("es_mode"), dict) else None,
-    ),
-    MarstekSensorEntityDescription(
-        key="grid_power",
-        name="Grid Power",
-        native_unit_of_measurement=UnitOfPower.WATT,
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-        # ongrid_power: negative = feeding to grid, positive = consuming from grid
-        value_fn=lambda data: data.get("es_mode", {}).get("ongrid_power") if isinstance(data.get("es_mode"), dict) else None,
-    ),
-
-    MarstekSensorEntityDescription(
-        key="battery_charging_power",
-        name="Battery Charging Power",
-        native_unit_of_measurement=UnitOfPower.WATT,
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-        icon="mdi:battery-charging",
-        # Positive value when battery is charging (ongrid_power < 0 = feeding to grid = charging)
-        value_fn=lambda data: abs(data.get("es_mode", {}).get("ongrid_power", 0)) if isinstance(data.get("es_mode"), dict) and data.get("es_mode", {}).get("ongrid_power", 0) < 0 else 0,
-    ),
-    MarstekSensorEntityDescription(
-        key="battery_discharging_power",
-        name="Battery Discharging Power",
-        native_unit_of_measurement=UnitOfPower.WATT,
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-        icon="mdi:battery-minus",
-        # Positive value when battery is discharging (ongrid_power > 0 = consuming from grid = discharging)
-        value_fn=lambda data: data.get("es_mode", {}).get("ongrid_power", 0) if isinstance(data.get("es_mode"), dict) and data.get("es_mode", {}).get("ongrid_power", 0) > 0 else 0,
-    ),
-    MarstekSensorEntityDescription(
-        key="offgrid_power",
-        name="Off-Grid Power",
-        native_unit_of_measurement=UnitOfPower.WATT,
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("es_mode", {}).get("offgrid_power") if isinstance(data.get("es_mode"), dict) else None,
-    ),
-    MarstekSensorEntityDescription(
-        key="phase_a_power",
-        name="Phase A Power",
-        native_unit_of_measurement=UnitOfPower.WATT,
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("es_mode", {}).get("a_power") if isinstance(data.get("es_mode"), dict) else None,
-    ),
-    MarstekSensorEntityDescription(
-        key="phase_b_power",
-        name="Phase B Power",
-        native_unit_of_measurement=UnitOfPower.WATT,
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("es_mode", {}).get("b_power") if isinstance(data.get("es_mode"), dict) else None,
-    ),
-    MarstekSensorEntityDescription(
-        key="phase_c_power",
-        name="Phase C Power",
-        native_unit_of_measurement=UnitOfPower.WATT,
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("es_mode", {}).get("c_power") if isinstance(data.get("es_mode"), dict) else None,
-    ),
-    MarstekSensorEntityDescription(
-        key="total_power",
-        name="Total Power",
-        native_unit_of_measurement=UnitOfPower.WATT,
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("es_mode", {}).get("total_power") if isinstance(data.get("es_mode"), dict) else None,
-    ),
+    ("es_mode", "Energy Storage Mode", None, None, None, None),
+    ("grid_power", "Grid Power", UnitOfPower.WATT, SensorDeviceClass.POWER, SensorStateClass.MEASUREMENT, None),
+    ("battery_charging_power", "Battery Charging Power", UnitOfPower.WATT, SensorDeviceClass.POWER, SensorStateClass.MEASUREMENT, "mdi:battery-charging"),
+    ("battery_discharging_power", "Battery Discharging Power", UnitOfPower.WATT, SensorDeviceClass.POWER, SensorStateClass.MEASUREMENT, "mdi:battery-minus"),
+    ("offgrid_power", "Off-Grid Power", UnitOfPower.WATT, SensorDeviceClass.POWER, SensorStateClass.MEASUREMENT, None),
+    ("phase_a_power", "Phase A Power", UnitOfPower.WATT, SensorDeviceClass.POWER, SensorStateClass.MEASUREMENT, None),
+    ("phase_b_power", "Phase B Power", UnitOfPower.WATT, SensorDeviceClass.POWER, SensorStateClass.MEASUREMENT, None),
+    ("phase_c_power", "Phase C Power", UnitOfPower.WATT, SensorDeviceClass.POWER, SensorStateClass.MEASUREMENT, None),
+    ("total_power", "Total Power", UnitOfPower.WATT, SensorDeviceClass.POWER, SensorStateClass.MEASUREMENT, None),
     # Device info sensors (from Marstek.GetDevice)
-    MarstekSensorEntityDescription(
-        key="firmware_version",
-        name="Firmware Version",
-        value_fn=lambda data: data.get("device", {}).get("ver"),
-    ),
-    MarstekSensorEntityDescription(
-        key="wifi_ssid",
-        name="WiFi SSID",
-        value_fn=lambda data: data.get("device", {}).get("wifi_name"),
-    ),
+    ("firmware_version", "Firmware Version", None, None, None, None),
+    ("wifi_ssid", "WiFi SSID", None, None, None, None),
 )
 
 
+@cache
+def get_sensor_types() -> tuple[SensorEntityDescription, ...]:
+    """Build the sensor descriptions on first use."""
+    return tuple(
+        SensorEntityDescription(
+            key=key,
+            name=name,
+            native_unit_of_measurement=unit,
+            device_class=device_class,
+            state_class=state_class,
+            icon=icon,
+        )
+        for key, name, unit, device_class, state_class, icon in _SENSOR_TABLE
+    )
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -173,60 +84,41 @@ async def async_setup_entry(
     """Set up Marstek sensor based on a config entry."""
     coordinator: MarstekDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
+    # Data is already loaded by the first refresh, so no update before add
     async_add_entities(
-        MarstekSensor(coordinator, description, entry)
-        for description in SENSOR_TYPES
+        [
+            MarstekSensor(coordinator, description, entry)
+            for description in get_sensor_types()
+        ],
+        update_before_add=False,
     )
 
 
-class MarstekSensor(CoordinatorEntity[MarstekDataUpdateCoordinator], SensorEntity):
+class MarstekSensor(MarstekEntity, SensorEntity):
     """Representation of a Marstek sensor."""
 
-    entity_description: MarstekSensorEntityDescription
-    _attr_has_entity_name = True
+    entity_description: SensorEntityDescription
 
     def __init__(
         self,
         coordinator: MarstekDataUpdateCoordinator,
-        description: MarstekSensorEntityDescription,
+        description: SensorEntityDescription,
         entry: ConfigEntry,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.entity_description = description
-        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-
-        # Get device info from coordinator data
-        device_info = coordinator.data.get("device", {})
-        device_name = device_info.get("device", "Unknown")
-        firmware_ver = device_info.get("ver", "Unknown")
-
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": entry.title,
-            "manufacturer": "Marstek",
-            "model": device_name,
-            "sw_version": str(firmware_ver),
-        }
-
-    @property
-    def native_value(self) -> Any:
-        """Return the state of the sensor."""
-        if self.entity_description.value_fn is None:
-            return None
-        
-        value = self.entity_description.value_fn(self.coordinator.data)
-        
-        if value is None:
-            return None
-        
-        return value
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and self.native_value is not None
-        )
+        self._entry_id = entry.entry_id
+
+    @cached_property
+    def unique_id(self) -> str:
+        """Return the unique ID, built on first access."""
+        return f"{self._entry_id}_{self.entity_description.key}"
+
+    @callback
+    def _update_attrs(self) -> None:
+        """Look up the value in the flattened snapshot and cache the result."""
+        value = self.coordinator.data[DATA_FLAT].get(self.entity_description.key)
 
+        self._attr_native_value = value
+        self._attr_available = self.coordinator.last_update_success and value is not None